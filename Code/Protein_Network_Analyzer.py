@@ -1,14 +1,349 @@
 import networkx as nx
 import argparse
+import gzip
 import time
 import random
 import os
+import hashlib
+import heapq
+import pickle
+import subprocess
+import sys
+from array import array
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from string import Template
+from concurrent.futures import ProcessPoolExecutor
 from collections import Counter, defaultdict
-from itertools import combinations
+from operator import itemgetter
+from pathlib import Path
 from typing import List, Tuple
 
+
+_HTML_REPORT_TEMPLATE = Template("""\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Protein Network Analysis Report</title>
+    <style>
+        body { 
+            font-family: Arial, sans-serif; 
+            margin: 2rem; 
+            color: #333; 
+            line-height: 1.6; 
+        }
+        .container { 
+            max-width: 1200px; 
+            margin: 0 auto; 
+        }
+        table { 
+            width: 100%; 
+            border-collapse: collapse; 
+            margin: 1rem 0;
+            table-layout: fixed;
+        }
+        th, td { 
+            padding: 0.5rem; 
+            border: 1px solid #ddd; 
+            text-align: left;
+            min-width: 150px;
+            max-width: 300px;
+        }
+        td { 
+            white-space: nowrap;
+            overflow-x: auto;
+            position: relative;
+        }
+        td::-webkit-scrollbar {
+            height: 8px;
+        }
+        td::-webkit-scrollbar-track {
+            background: #f1f1f1;
+            border-radius: 4px;
+        }
+        td::-webkit-scrollbar-thumb {
+            background: #888;
+            border-radius: 4px;
+        }
+        td::-webkit-scrollbar-thumb:hover {
+            background: #555;
+        }
+        td.scrollable::after {
+            content: '⟷';
+            position: absolute;
+            right: 4px;
+            top: 50%;
+            transform: translateY(-50%);
+            color: #888;
+            font-size: 12px;
+            opacity: 0.7;
+        }
+        th { 
+            background-color: #f5f5f5; 
+            position: sticky;
+            top: 0;
+            z-index: 10;
+        }
+        tr:nth-child(even) { 
+            background-color: #f9f9f9; 
+        }
+        tr:hover { 
+            background-color: #f5f5f5; 
+        }
+        .section { 
+            margin: 2rem 0; 
+            padding: 1rem; 
+            border-radius: 5px; 
+            background-color: #fff; 
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1); 
+        }
+        .scrollable-wrapper {
+            overflow-x: auto;
+            margin: 1rem 0;
+            padding-bottom: 1rem;
+        }
+        h1, h2 { 
+            color: #2c3e50; 
+            margin-top: 0; 
+        }
+        .meta-info { 
+            color: #666; 
+            font-size: 0.9rem; 
+        }
+        .sticky-header { 
+            position: sticky; 
+            top: 0; 
+            background-color: white; 
+            z-index: 20; 
+            padding: 1rem 0; 
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="sticky-header">
+            <h1>Protein Network Analysis Report</h1>
+            <div class="meta-info">
+                <p>Generated on: $generated_on</p>
+                <p>Total execution time: $execution_time seconds</p>
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>Network Overview</h2>
+            <div class="scrollable-wrapper">
+                <p>Total proteins found: $num_proteins</p>
+                <p>Total nodes in network: $num_nodes</p>
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>Shortest Paths Analysis</h2>
+            <div class="scrollable-wrapper">
+                $paths_html
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>Node Frequencies</h2>
+            <div class="scrollable-wrapper">
+                $frequencies_html
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>Centrality Analysis</h2>
+            <div class="scrollable-wrapper">
+                $centrality_html
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+_HTML_ESCAPES = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+})
+
+
+def _html_escape(text) -> str:
+    """
+    Escape a value for safe inclusion in the HTML report.
+
+    Args:
+        text: Value to escape, converted with str()
+
+    Returns:
+        str: The text with HTML special characters replaced by entities
+    """
+    return str(text).translate(_HTML_ESCAPES)
+
+
+def _build_csr(adjacency, node_to_id: dict) -> Tuple[array, array]:
+    """
+    Flatten an adjacency mapping into Compressed Sparse Row arrays.
+
+    Args:
+        adjacency (Mapping): Neighbors of each node, such as a graph's ``adj``
+        node_to_id (dict): Mapping of nodes to contiguous integer IDs, in ID order
+
+    Returns:
+        Tuple[array, array]: ``indptr`` and ``indices`` arrays, where the neighbors
+            of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``
+    """
+    indptr = array('i', [0])
+    indices = array('i')
+    for node in node_to_id:
+        indices.extend(node_to_id[neighbor] for neighbor in adjacency[node])
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+def _component_labels(indptr: array, indices: array) -> array:
+    """
+    Label the connected components of an undirected graph stored as CSR arrays.
+
+    Args:
+        indptr (array): CSR row pointers
+        indices (array): CSR column indices
+
+    Returns:
+        array: Component label of every node, by node ID
+    """
+    labels = array('i', [-1]) * (len(indptr) - 1)
+    label = 0
+    for start in range(len(labels)):
+        if labels[start] >= 0:
+            continue
+        labels[start] = label
+        stack = [start]
+        while stack:
+            v = stack.pop()
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if labels[w] < 0:
+                    labels[w] = label
+                    stack.append(w)
+        label += 1
+    return labels
+
+
+def _bfs_predecessors(indptr: array, indices: array, source: int, targets=None) -> Tuple[list, list]:
+    """
+    Run a breadth-first search over CSR arrays and record shortest-path predecessors.
+
+    When targets are given, the search stops as soon as the level holding the
+    farthest target is complete, since no shortest path to a target goes deeper.
+
+    Args:
+        indptr (array): CSR row pointers
+        indices (array): CSR column indices
+        source (int): ID of the source node
+        targets (iterable, optional): IDs of the nodes of interest. Defaults to None (full search)
+
+    Returns:
+        Tuple[list, list]: Distance of every node from the source (-1 if unreached) and
+            list of predecessor IDs of every node (None if unreached)
+    """
+    dist = [-1] * (len(indptr) - 1)
+    preds = [None] * (len(indptr) - 1)
+    dist[source] = 0
+    preds[source] = []
+
+    remaining = None if targets is None else set(targets) - {source}
+    stop_dist = 0 if remaining is not None and not remaining else len(dist)
+
+    order = [source]
+    for v in order:
+        next_dist = dist[v] + 1
+        if next_dist > stop_dist:
+            break
+        for w in indices[indptr[v]:indptr[v + 1]]:
+            if dist[w] < 0:
+                dist[w] = next_dist
+                preds[w] = [v]
+                order.append(w)
+                if remaining and w in remaining:
+                    remaining.discard(w)
+                    if not remaining:
+                        stop_dist = next_dist
+            elif dist[w] == next_dist:
+                preds[w].append(v)
+    return dist, preds
+
+
+def _enumerate_paths(preds: list, source: int, target: int):
+    """
+    Lazily enumerate all shortest paths to a target by walking a predecessor DAG back to the source.
+
+    Args:
+        preds (list): Predecessor IDs of every node on shortest paths from the source
+        source (int): ID of the source node of the predecessor DAG
+        target (int): ID of the node whose shortest paths are enumerated
+
+    Yields:
+        List[int]: Shortest paths as node IDs, each ordered from source to target
+    """
+    stack = [(target, [target])]
+    while stack:
+        node, reversed_path = stack.pop()
+        if node == source:
+            yield reversed_path[::-1]
+            continue
+        for parent in preds[node]:
+            stack.append((parent, reversed_path + [parent]))
+
+
+def _shortest_paths_from_csr(indptr: array, indices: array, source: int,
+                             targets: List[int]) -> dict:
+    """
+    Find all shortest paths from one source to several targets with a single BFS.
+
+    Args:
+        indptr (array): CSR row pointers
+        indices (array): CSR column indices
+        source (int): ID of the source node
+        targets (List[int]): IDs of the target nodes
+
+    Returns:
+        dict: Mapping of each reachable target ID to an iterator over its shortest paths as node IDs
+    """
+    _, preds = _bfs_predecessors(indptr, indices, source, targets)
+    return {target: _enumerate_paths(preds, source, target)
+            for target in targets if preds[target] is not None}
+
+
+_worker_csr = None
+
+
+def _init_path_worker(indptr: array, indices: array):
+    """
+    Store the CSR arrays in a worker process once, so tasks only carry node IDs.
+
+    Args:
+        indptr (array): CSR row pointers
+        indices (array): CSR column indices
+    """
+    global _worker_csr
+    _worker_csr = (indptr, indices)
+
+
+def _shortest_paths_in_worker(source: int, targets: List[int]) -> dict:
+    """
+    Worker-process entry point for _shortest_paths_from_csr on the stored CSR arrays.
+
+    Args:
+        source (int): ID of the source node
+        targets (List[int]): IDs of the target nodes
+
+    Returns:
+        dict: Mapping of each reachable target ID to its list of shortest paths as node IDs
+    """
+    paths_by_target = _shortest_paths_from_csr(*_worker_csr, source, targets)
+    return {target: list(paths) for target, paths in paths_by_target.items()}
+
+
 class ProteinNetworkAnalyzer:
     """
     A class for analyzing protein interaction networks from GraphML files.
@@ -18,16 +353,25 @@ class ProteinNetworkAnalyzer:
 
     Attributes:
         DEFAULT_BLACKLIST (set): Default set of metabolites and small molecules to exclude
-        graph (NetworkX.Graph): The loaded network graph
+        PARALLEL_MIN_SOURCES (int): Minimum number of BFS sources for the analysis to use a process pool
+        TXT_REPORT_HEADER (str): Format string for the opening sections of the text report
+        verbose (bool): Whether progress messages are printed
+        graph (NetworkX.Graph): The loaded network graph, keyed by its GraphML node IDs
         threshold (float): Threshold value for filtering interactions
         blacklist (set): Current set of nodes to exclude from analysis
         node_types (dict): Mapping of nodes to their biological types
         proteins (list): List of valid protein nodes after filtering
-        shortest_paths (list): List of all analyzed shortest paths
+        shortest_paths (list): Analyzed shortest paths as (start_id, end_id, path_ids, length)
+            tuples, where path_ids is an array of node IDs (see id_to_node)
         pair_frequencies (dict): Frequencies of nodes in paths between specific pairs
         normalized_frequencies (dict): Overall normalized node frequencies
         analyzed_nodes (set): Set of all nodes encountered in analysis
+        selected_proteins (list): Proteins selected for the last path analysis
         undirected_graph (NetworkX.Graph): Undirected version of the network
+        node_to_id (dict): Mapping of node names to contiguous integer IDs
+        id_to_node (list): Node names indexed by their integer ID
+        type_names (list): Sorted names of the node types present in the network
+        node_type_id (array): Index into type_names of each node's type, by node ID
 
     Args:
         graphml_file (str): Path to the GraphML file containing the network
@@ -39,7 +383,24 @@ class ProteinNetworkAnalyzer:
         'ATP', 'ADP','NADH', 'NAD+','NADPH', 'NADP+','FADH2', 'FAD','Pyruvate','Pi', 'Phosphate',
         'PPi', 'Pyrophosphate','H+', 'Proton','CO2','H2O','O2', 'water'}
 
-    def __init__(self, graphml_file: str, custom_blacklist: set = None):
+    PARALLEL_MIN_SOURCES = 64
+
+    # Part of the network and path analysis cache file names: bump it whenever
+    # _prepare_network or analyze_paths changes what those caches hold
+    CACHE_FORMAT_VERSION = 1
+
+    TXT_REPORT_HEADER = (
+        "=== Protein Network Analysis ===\n"
+        "Executed on: {executed_on}\n"
+        "Execution time: {execution_time:.2f} seconds\n\n"
+        "=== General Statistics ===\n"
+        "Number of proteins: {num_proteins}\n"
+        "Analyzed paths: {num_paths}\n\n"
+        "=== Shortest Paths ==="
+    )
+
+    def __init__(self, graphml_file: str, custom_blacklist: set = None, use_cache: bool = True,
+                 verbose: bool = True):
         """
         Initialize the ProteinNetworkAnalyzer with a GraphML file and analysis parameters.
         
@@ -47,52 +408,226 @@ class ProteinNetworkAnalyzer:
             graphml_file (str): Path to the GraphML file containing the protein network
             threshold (float, optional): Threshold value for filtering interactions. Defaults to 0.9
             custom_blacklist (set, optional): Set of node names to exclude from analysis. Defaults to None
+            use_cache (bool, optional): Reuse pickled copies of the parsed GraphML file, of
+                the prepared network structures and of previous path analyses. Defaults to True
+            verbose (bool, optional): Print progress messages during analysis and reporting.
+                Defaults to True
         """
-        self.graph = nx.read_graphml(graphml_file)
+        self.verbose = verbose
+        self.graph = self._load_graph(graphml_file, use_cache)
+        self._cache_prefix = (f"{graphml_file}.cache.{os.path.getmtime(graphml_file):.0f}"
+                              if use_cache else None)
         self.blacklist = self.DEFAULT_BLACKLIST.union(custom_blacklist or set())
+        self._precompute_blacklist()
         self._initialize_network()
+
+    @staticmethod
+    def _load_graph(graphml_file: str, use_cache: bool = True):
+        """
+        Read a GraphML file, reusing a pickled copy of the parsed graph when available.
+
+        The cache file sits next to the GraphML file and its name embeds the
+        modification time of the GraphML file, so editing the network
+        invalidates it.
+
+        Args:
+            graphml_file (str): Path to the GraphML file containing the protein network
+            use_cache (bool, optional): Whether to read and write the cache. Defaults to True
+
+        Returns:
+            NetworkX.Graph: The parsed network graph
+        """
+        if not use_cache:
+            return nx.read_graphml(graphml_file)
+
+        cache_path = f"{graphml_file}.cache.{os.path.getmtime(graphml_file):.0f}.pkl"
+        graph = ProteinNetworkAnalyzer._read_cache(cache_path)
+        if not isinstance(graph, nx.Graph):
+            graph = nx.read_graphml(graphml_file)
+            ProteinNetworkAnalyzer._write_cache(cache_path, graph)
+        return graph
+
+    @staticmethod
+    def _read_cache(cache_path: str, length: int = None):
+        """
+        Load a pickled cache file.
+
+        Any failure to load the file, such as a truncated file or a pickle written
+        by an older version of the analyzer, is treated as a cache miss.
+
+        Args:
+            cache_path (str): Path to the cache file
+            length (int, optional): Number of items the cached tuple must have.
+                Defaults to None, which accepts any object
+
+        Returns:
+            object: The cached object, or None if the file is missing, unreadable or
+                does not have the expected shape
+        """
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable cache {cache_path}: {e}")
+            return None
+        if length is not None and not (isinstance(cached, tuple) and len(cached) == length):
+            print(f"Ignoring outdated cache {cache_path}")
+            return None
+        return cached
+
+    @staticmethod
+    def _write_cache(cache_path: str, obj):
+        """
+        Pickle an object to a cache file, replacing the file atomically.
+
+        Args:
+            cache_path (str): Path to the cache file
+            obj (object): Object to store
+        """
+        try:
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Could not write cache {cache_path}: {e}")
+
+    def _log(self, *lines: str):
+        """
+        Print progress messages unless the analyzer was created with verbose=False.
+
+        All lines are written to stdout in a single call.
+
+        Args:
+            *lines (str): Lines of the message to print
+        """
+        if self.verbose:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def _precompute_blacklist(self):
+        """
+        Normalize the blacklist once so that each node check is a set lookup.
+
+        Builds the set of uppercase blacklist entries used for exact matching and
+        the word sets used to match node names containing every word of an entry.
+        """
+        self._bl_exact = {item.upper().strip() for item in self.blacklist}
+        self._bl_wordsets = [frozenset(item.upper().split()) for item in self.blacklist
+                             if item.split()]
         
     def _initialize_network(self):
         """
         Initialize the network by setting up internal data structures and attributes.
         
         This method:
-        - Relabels nodes using their names
-        - Identifies node types
+        - Loads the prepared network structures, from the cache when available
         - Filters protein nodes against blacklist
         - Initializes data structures for path analysis
         - Creates an undirected version of the graph
         """
-        self._relabel_nodes()
-    
-        self.node_types = {}
-        for node in self.graph.nodes:
-            self.node_types[node] = self.graph.nodes[node].get('biopaxType', 'Unknown')
+        cache_path = (f"{self._cache_prefix}.network.v{self.CACHE_FORMAT_VERSION}.pkl"
+                      if self._cache_prefix else None)
+        network = self._read_cache(cache_path, length=8) if cache_path else None
+        if network is None:
+            network = self._prepare_network()
+            if cache_path:
+                self._write_cache(cache_path, network)
+        (self.node_types, self.id_to_node, self.node_to_id, self.type_names, self.node_type_id,
+         self._undirected_csr, self._directed_csr, self._component_of) = network
         
-        self.proteins = [node for node in self.graph.nodes 
+        self.proteins = [node for node in self.node_types 
                         if self.node_types[node] == 'Protein' 
                         and not self._is_blacklisted(str(node))]
         
         self.shortest_paths = []
+        # Positions in shortest_paths of the paths of each length
+        self._paths_by_length = defaultdict(list)
         self.pair_frequencies = {}
-        self.normalized_frequencies = defaultdict(lambda: defaultdict(float))
+        self.normalized_frequencies = {}
         self.analyzed_nodes = set()
+        self.selected_proteins = []
+        self._dependencies = defaultdict(float)
+        self._node_frequencies = defaultdict(float)
+        self._centrality_scores = None
+        self._path_strings_cache = {}
+        self._path_memo = {}
+        self._directed_analysis = True
         
         self.directed_graph = self.graph
-        self.undirected_graph = self.graph.to_undirected()
+        self.undirected_graph = (self.graph.to_undirected(as_view=True)
+                                 if self.graph.is_directed() else self.graph)
+
+    def _prepare_network(self) -> tuple:
+        """
+        Build the network structures used by the path analysis from the graph.
+
+        Names nodes after their 'name' attribute, identifies node types, maps nodes
+        to integer IDs, encodes their types and builds CSR adjacency arrays and
+        connected component labels. None of these depend on the blacklist, so the
+        result can be cached alongside the parsed graph.
+
+        Returns:
+            tuple: Node types by name, node names by ID, node IDs by name, sorted type
+                names, type index by node ID, undirected and directed CSR adjacency
+                arrays, and component label by node ID
+        """
+        node_attributes, successors, predecessors = self._index_nodes_by_name()
     
-    def _relabel_nodes(self):
+        node_types = {}
+        for node, attributes in node_attributes.items():
+            node_types[node] = sys.intern(attributes.get('biopaxType', 'Unknown'))
+
+        id_to_node = list(node_attributes)
+        node_to_id = {node: i for i, node in enumerate(id_to_node)}
+        type_names = sorted(set(node_types.values()))
+        type_codes = {node_type: code for code, node_type in enumerate(type_names)}
+        node_type_id = array('H', (type_codes[node_types[node]] for node in id_to_node))
+        if predecessors is None:
+            undirected_csr = _build_csr(successors, node_to_id)
+            directed_csr = undirected_csr
+        else:
+            # Same neighbor order as iterating an undirected view of a DiGraph
+            undirected_csr = _build_csr(
+                {node: set(successors[node].keys()) | set(predecessors[node].keys()) for node in successors},
+                node_to_id
+            )
+            directed_csr = _build_csr(successors, node_to_id)
+        return (node_types, id_to_node, node_to_id, type_names, node_type_id,
+                undirected_csr, directed_csr, _component_labels(*undirected_csr))
+    
+    def _index_nodes_by_name(self):
         """
-        Relabel network nodes using their 'name' attribute if available.
-        
-        Modifies the graph in place by replacing node IDs with their corresponding
-        names from the 'name' attribute of each node.
+        Name network nodes after their 'name' attribute, without relabeling the graph.
+
+        Nodes keep their GraphML ID when they have no 'name' attribute. Nodes
+        sharing a name are merged, keeping the attributes of the last one and
+        the union of their edges, exactly as relabeling the graph by name would.
+        Names are interned so that every path and frequency table shares a
+        single string object per node.
+
+        Returns:
+            Tuple[dict, dict, dict]: Node attributes keyed by name, in node order, the
+                neighbors of each named node (successors for a directed graph), and the
+                predecessors of each named node, or None for an undirected graph
         """
-        new_names = {}
-        for node in self.graph.nodes:
-            if 'name' in self.graph.nodes[node]:
-                new_names[node] = self.graph.nodes[node]['name']
-        self.graph = nx.relabel_nodes(self.graph, new_names)
+        node_names = {}
+        node_attributes = {}
+        for node, attributes in self.graph.nodes(data=True):
+            name = sys.intern(str(attributes['name'])) if 'name' in attributes else node
+            node_names[node] = name
+            node_attributes[name] = attributes
+
+        directed = self.graph.is_directed()
+        # Dicts keep neighbors unique and in the order the edges are found
+        successors = {name: {} for name in node_attributes}
+        predecessors = {name: {} for name in node_attributes} if directed else successors
+        for u, v in self.graph.edges():
+            u, v = node_names[u], node_names[v]
+            successors[u][v] = None
+            predecessors[v][u] = None
+        return node_attributes, successors, predecessors if directed else None
 
 
     def _is_blacklisted(self, node_name: str) -> bool:
@@ -106,17 +641,11 @@ class ProteinNetworkAnalyzer:
             bool: True if node is blacklisted, False otherwise
         """
         node_name = str(node_name).upper().strip()
-        
-        if any(node_name == item.upper().strip() for item in self.blacklist):
+        if node_name in self._bl_exact:
             return True
-            
-        node_words = set(node_name.split())
-        for blacklisted in self.blacklist:
-            blacklisted_words = set(blacklisted.upper().strip().split())
-            if blacklisted_words and blacklisted_words.issubset(node_words):
-                return True
-                
-        return False
+
+        node_words = frozenset(node_name.split())
+        return any(words <= node_words for words in self._bl_wordsets)
     
     def select_nodes(self, num_nodes=None, node_list=None):
         """
@@ -141,16 +670,19 @@ class ProteinNetworkAnalyzer:
                     "No valid protein nodes found after filtering blacklist. "
                     "Use --disable-blacklist to include blacklisted nodes."
                 )
-            return random.sample(self.proteins, min(num_nodes, len(self.proteins)))
+            num_proteins = len(self.proteins)
+            return random.sample(self.proteins, min(num_nodes, num_proteins))
         
         blacklisted_nodes = []
         missing_nodes = []
         valid_nodes = []
         
+        node_to_id = self.node_to_id
+        is_blacklisted = self._is_blacklisted
         for node in node_list:
-            if node not in self.graph.nodes():
+            if node not in node_to_id:
                 missing_nodes.append(node)
-            elif self._is_blacklisted(str(node)):
+            elif is_blacklisted(str(node)):
                 blacklisted_nodes.append(node)
             else:
                 valid_nodes.append(node)
@@ -174,45 +706,69 @@ class ProteinNetworkAnalyzer:
             
         return valid_nodes
 
-    def find_all_shortest_paths(self, start: str, end: str) -> list:
-        """
-        Find all shortest paths between two nodes in the network.
-
-        Args:
-            start (str): Starting node identifier
-            end (str): Target node identifier
-            
-        Returns:
-            list: List of paths, where each path is a list of node identifiers.
-                Returns None if no path exists between the nodes.
-        """
-        try:
-            return list(nx.all_shortest_paths(self.undirected_graph, source=start, target=end))
-        except (nx.NetworkXNoPath, nx.NetworkXError):
-            return None
-
-    def _compute_pair_frequencies(self, paths: List[List[str]], pair: Tuple[str, str]):
+    def _compute_pair_frequencies(self, node_counts: Counter, num_paths: int, source: int, target: int):
         """
         Calculate normalized frequencies for a specific pair of nodes.
+
+        Also accumulates the overall frequency of each node on the pair's paths and
+        the betweenness dependency of the pair's intermediate nodes, both by node ID.
         
         Args:
-            paths (List[List[str]]): List of shortest paths for this pair of nodes
-            pair (Tuple[str, str]): Tuple containing the node pair (start, end)
+            node_counts (Counter): Number of shortest paths of the pair through each node ID
+            num_paths (int): Number of shortest paths between the pair
+            source (int): ID of the first node of the pair
+            target (int): ID of the second node of the pair
         """
-        if not paths:
+        if not num_paths:
             return
         
-        node_counts = Counter(node for path in paths for node in path)
-        num_paths = len(paths)
         normalized_freqs = defaultdict(dict)
         
-        for node, count in node_counts.items():
-            node_type = self.node_types.get(node, 'Unknown')
+        id_to_node, type_names, node_type_id = self.id_to_node, self.type_names, self.node_type_id
+        node_frequencies = self._node_frequencies
+        for node_id, count in node_counts.items():
+            node = id_to_node[node_id]
+            node_type = type_names[node_type_id[node_id]]
             norm_freq = count / num_paths
             normalized_freqs[node_type][node] = norm_freq
-            self.normalized_frequencies[node_type][node] += norm_freq
+            node_frequencies[node_id] += norm_freq
         
-        self.pair_frequencies[pair] = normalized_freqs
+        self._accumulate_dependencies(node_counts, num_paths, source, target)
+        self.pair_frequencies[(id_to_node[source], id_to_node[target])] = normalized_freqs
+
+    def _accumulate_dependencies(self, node_counts: Counter, num_paths: int, source: int, target: int):
+        """
+        Add the betweenness dependency of a pair's intermediate nodes, by node ID.
+
+        The dependency of a node on the pair is the fraction of the pair's
+        shortest paths that go through it.
+
+        Args:
+            node_counts (Counter): Number of shortest paths of the pair through each node ID
+            num_paths (int): Number of shortest paths between the pair
+            source (int): ID of the first node of the pair
+            target (int): ID of the second node of the pair
+        """
+        dependencies = self._dependencies
+        for node_id, count in node_counts.items():
+            if node_id != source and node_id != target:
+                dependencies[node_id] += count / num_paths
+
+    def _frequencies_by_type(self, node_frequencies: dict) -> dict:
+        """
+        Group per-node frequencies by node type.
+
+        Args:
+            node_frequencies (dict): Frequencies keyed by node ID
+
+        Returns:
+            dict: Frequencies as {node_type: {node: frequency}}, in first-seen order
+        """
+        id_to_node, type_names, node_type_id = self.id_to_node, self.type_names, self.node_type_id
+        by_type = {}
+        for node_id, frequency in node_frequencies.items():
+            by_type.setdefault(type_names[node_type_id[node_id]], {})[id_to_node[node_id]] = frequency
+        return by_type
 
     def get_normalized_frequencies(self):
         """
@@ -223,6 +779,39 @@ class ProteinNetworkAnalyzer:
         """
         return dict(self.normalized_frequencies)
 
+    def _path_strings(self, separator: str) -> list:
+        """
+        Get the node names of every shortest path joined with a separator.
+
+        The strings are built once per separator and reused by later reports
+        until the next path analysis.
+
+        Args:
+            separator (str): String placed between consecutive node names
+
+        Returns:
+            list: Joined path strings, in the same order as shortest_paths
+        """
+        path_strings = self._path_strings_cache.get(separator)
+        if path_strings is None:
+            id_to_node = self.id_to_node
+            path_strings = [separator.join([id_to_node[node_id] for node_id in path_ids])
+                            for _, _, path_ids, _ in self.shortest_paths]
+            self._path_strings_cache[separator] = path_strings
+        return path_strings
+
+    def _csr(self, directed: bool = True) -> Tuple[array, array]:
+        """
+        Return the CSR adjacency arrays of the directed or undirected network.
+
+        Args:
+            directed (bool): Whether to respect edge direction (default: True)
+
+        Returns:
+            Tuple[array, array]: ``indptr`` and ``indices`` arrays over node IDs
+        """
+        return self._directed_csr if directed else self._undirected_csr
+
     def find_all_shortest_paths(self, start: str, end: str, directed: bool = True) -> list:
         """
         Find all shortest paths between two nodes in the network.
@@ -236,12 +825,104 @@ class ProteinNetworkAnalyzer:
             list: List of paths, where each path is a list of node identifiers.
                 Returns None if no path exists between the nodes.
         """
-        try:
-            graph = self.directed_graph if directed else self.undirected_graph
-            return list(nx.all_shortest_paths(graph, source=start, target=end))
-        except (nx.NetworkXNoPath, nx.NetworkXError):
+        source = self.node_to_id.get(start)
+        target = self.node_to_id.get(end)
+        if source is None or target is None:
+            return None
+        if self._component_of[source] != self._component_of[target]:
             return None
 
+        paths = self._memoized_paths(source, target, directed)
+        if paths is None:
+            indptr, indices = self._csr(directed)
+            _, preds = _bfs_predecessors(indptr, indices, source, (target,))
+            # Unreachable pairs are memoized too, as an empty tuple
+            paths = (tuple(array('i', path) for path in _enumerate_paths(preds, source, target))
+                     if preds[target] is not None else ())
+            self._path_memo[directed, source, target] = paths
+        if not paths:
+            return None
+        return [[self.id_to_node[i] for i in path] for path in paths]
+
+    def _memoized_paths(self, source: int, target: int, directed: bool = True):
+        """
+        Look up the shortest paths already computed between two node IDs.
+
+        In an undirected analysis the paths of a pair are the reversed paths of
+        the opposite pair, so either orientation can answer the lookup.
+
+        Args:
+            source (int): ID of the starting node
+            target (int): ID of the target node
+            directed (bool): Whether edge direction is respected (default: True)
+
+        Returns:
+            tuple: Paths from source to target as arrays of node IDs (empty if the
+                target is unreachable), or None if the pair has not been computed
+        """
+        paths = self._path_memo.get((directed, source, target))
+        if paths is None and not directed:
+            reverse_paths = self._path_memo.get((False, target, source))
+            if reverse_paths is not None:
+                paths = tuple(path[::-1] for path in reverse_paths)
+        return paths
+
+    def _iter_paths_by_source(self, sources: List[int], targets: List[List[int]],
+                              directed: bool = True):
+        """
+        Find all shortest paths from each source to its targets, one BFS per source.
+
+        The predecessor DAG of each source is computed once and every target's
+        shortest paths are then enumerated from it, instead of running one
+        traversal per (source, target) pair. With at least PARALLEL_MIN_SOURCES
+        sources the traversals are spread over a process pool; results are
+        yielded in source order either way.
+
+        Args:
+            sources (List[int]): IDs of the starting nodes
+            targets (List[List[int]]): IDs of the target nodes of each source
+            directed (bool): Whether to respect edge direction (default: True)
+
+        Yields:
+            dict: Mapping of each reachable target ID to its shortest paths as node IDs,
+                either as a list or as an iterator to be consumed once
+        """
+        indptr, indices = self._csr(directed)
+        workers = os.cpu_count() or 1
+        if len(sources) < self.PARALLEL_MIN_SOURCES or workers < 2:
+            for source, source_targets in zip(sources, targets):
+                yield _shortest_paths_from_csr(indptr, indices, source, source_targets)
+            return
+
+        chunksize = max(1, len(sources) // (4 * workers))
+        with ProcessPoolExecutor(initializer=_init_path_worker,
+                                 initargs=(indptr, indices)) as executor:
+            yield from executor.map(_shortest_paths_in_worker, sources, targets,
+                                    chunksize=chunksize)
+
+    def _analysis_cache_path(self, selected_proteins: list, directed: bool):
+        """
+        Get the cache file used for a path analysis of the given proteins.
+
+        Only analyses of a fresh analyzer are cached, since later analyses add
+        their paths to those already collected. The file name is derived from
+        the GraphML file, its modification time, CACHE_FORMAT_VERSION, the
+        selected proteins, the direction and the blacklist. The key keeps the selection order, since
+        pairs and their paths are reported from the protein selected first.
+
+        Args:
+            selected_proteins (List[str]): Proteins selected for the analysis
+            directed (bool): Whether edge direction is respected
+
+        Returns:
+            str: Path of the cache file, or None if the analysis should not be cached
+        """
+        if self._cache_prefix is None or self.shortest_paths or self.analyzed_nodes or self.pair_frequencies:
+            return None
+        key = repr((tuple(selected_proteins), directed, sorted(self.blacklist)))
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+        return f"{self._cache_prefix}.paths.v{self.CACHE_FORMAT_VERSION}.{digest}.pkl"
+
     def analyze_paths(self, num_nodes=None, node_list=None, directed: bool = True):
         """
         Analyze shortest paths between selected proteins in the network.
@@ -254,39 +935,126 @@ class ProteinNetworkAnalyzer:
         Returns:
             int: Total number of shortest paths found in the analysis
         """
-        print(f"\n=== Starting {'Directed' if directed else 'Undirected'} Path Analysis ===")
+        self._log(f"\n=== Starting {'Directed' if directed else 'Undirected'} Path Analysis ===")
         
         try:
             selected_proteins = self.select_nodes(num_nodes, node_list)
-            pairs = list(combinations(selected_proteins, 2))
-            print(f"Analyzing all paths between {len(selected_proteins)} nodes...")
-            print(f"Analyzing {len(pairs)} pairs")
+            self.selected_proteins = selected_proteins
+            num_pairs = len(selected_proteins) * (len(selected_proteins) - 1) // 2
+            self._log(f"Analyzing all paths between {len(selected_proteins)} nodes...",
+                      f"Analyzing {num_pairs} pairs")
             
             total_paths_found = 0
-            self.normalized_frequencies = defaultdict(lambda: defaultdict(float))
-            
-            for p1, p2 in pairs:
-                pair = (p1, p2)
-                paths = self.find_all_shortest_paths(p1, p2, directed=directed)
-                
-                if paths:
-                    total_paths_found += len(paths)
-                    self._compute_pair_frequencies(paths, pair)
-                    
-                    for path in paths:
-                        self.shortest_paths.append({
-                            'start': path[0],
-                            'end': path[-1],
-                            'path': path,
-                            'length': len(path) - 1,
-                            'directed': directed
-                        })
-                        
-                        for node in path:
-                            self.analyzed_nodes.add(node)
+            self.normalized_frequencies = {}
+            self._dependencies = defaultdict(float)
+            self._node_frequencies = defaultdict(float)
+            self._centrality_scores = None
+            self._directed_analysis = directed
+            self._path_strings_cache = {}
+
+            # A random selection is practically never drawn again, so caching it
+            # would only leave files behind
+            cache_path = (self._analysis_cache_path(selected_proteins, directed)
+                          if num_nodes is None else None)
+            cached = self._read_cache(cache_path, length=6) if cache_path else None
+            if cached is not None:
+                (self.shortest_paths, self.pair_frequencies, self.normalized_frequencies,
+                 self.analyzed_nodes, self._dependencies, total_paths_found) = cached
+                self._paths_by_length = defaultdict(list)
+                for index, path_info in enumerate(self.shortest_paths):
+                    self._paths_by_length[path_info[3]].append(index)
+                self._log(f"Loaded cached analysis from {cache_path}",
+                          f"Found {total_paths_found} shortest paths analyzing {num_pairs} pairs",
+                          "=== Path Analysis Complete ===\n")
+                return total_paths_found
             
-            print(f"Found {total_paths_found} shortest paths analyzing {len(pairs)} pairs")
-            print("=== Path Analysis Complete ===\n")
+            id_to_node = self.id_to_node
+            selected_ids = [self.node_to_id[node] for node in selected_proteins]
+            # Pairs in different components have no path: skip them before any BFS
+            component_of = self._component_of
+            path_memo = self._path_memo
+            shortest_paths, paths_by_length = self.shortest_paths, self._paths_by_length
+            sources, targets_by_source, reverse_targets_by_source = [], [], []
+            # Only pairs not seen by a previous analysis need a BFS
+            search_sources, search_targets = [], []
+            for i, p1 in enumerate(selected_ids):
+                component = component_of[p1]
+                targets = [p2 for p2 in selected_ids[i + 1:] if component_of[p2] == component]
+                # Pairs are reported from the protein selected first, but a directed
+                # centrality also counts the paths in the opposite orientation
+                reverse_targets = ([p2 for p2 in selected_ids[:i] if component_of[p2] == component]
+                                   if directed else [])
+                if targets or reverse_targets:
+                    sources.append(p1)
+                    targets_by_source.append(targets)
+                    reverse_targets_by_source.append(reverse_targets)
+                    missing = [p2 for p2 in targets + reverse_targets
+                               if (directed, p1, p2) not in path_memo
+                               and (directed or (False, p2, p1) not in path_memo)]
+                    if missing:
+                        search_sources.append(p1)
+                        search_targets.append(missing)
+            reused_pairs = (sum(map(len, targets_by_source)) + sum(map(len, reverse_targets_by_source))
+                            - sum(map(len, search_targets)))
+            if reused_pairs:
+                self._log(f"Reusing previously computed paths for {reused_pairs} pairs")
+
+            analyzed_ids = set()
+            results = zip(search_sources, search_targets,
+                          self._iter_paths_by_source(search_sources, search_targets, directed=directed))
+            pending = next(results, None)
+            try:
+                for p1, targets, reverse_targets in zip(sources, targets_by_source,
+                                                        reverse_targets_by_source):
+                    if pending is not None and pending[0] == p1:
+                        _, missing, paths_by_target = pending
+                        for p2 in missing:
+                            # Paths are kept as node IDs and only named at report time
+                            path_memo[directed, p1, p2] = tuple(
+                                array('i', path_ids) for path_ids in paths_by_target.get(p2, ()))
+                        pending = next(results, None)
+
+                    for p2 in targets:
+                        pair_paths = self._memoized_paths(p1, p2, directed)
+                        if not pair_paths:
+                            continue
+                        node_counts = Counter()
+                        for path_ids in pair_paths:
+                            node_counts.update(path_ids)
+                        self._compute_pair_frequencies(node_counts, len(pair_paths), p1, p2)
+
+                        # Paths are recorded only once the pair is counted, so a Ctrl-C
+                        # never reports paths missing from the frequencies and centrality
+                        for path_ids in pair_paths:
+                            length = len(path_ids) - 1
+                            paths_by_length[length].append(len(shortest_paths))
+                            shortest_paths.append((p1, p2, path_ids, length))
+                        total_paths_found += len(pair_paths)
+                        # The counted nodes are exactly the nodes on this pair's paths
+                        analyzed_ids.update(node_counts)
+
+                    for p2 in reverse_targets:
+                        pair_paths = self._memoized_paths(p1, p2, directed)
+                        if not pair_paths:
+                            continue
+                        node_counts = Counter()
+                        for path_ids in pair_paths:
+                            node_counts.update(path_ids)
+                        # Not reported as a pair: these paths only count towards centrality
+                        self._accumulate_dependencies(node_counts, len(pair_paths), p1, p2)
+                        analyzed_ids.update(node_counts)
+            finally:
+                # Also runs on Ctrl-C, so the pairs completed so far remain reportable
+                self.analyzed_nodes.update(id_to_node[node_id] for node_id in analyzed_ids)
+                self.normalized_frequencies = self._frequencies_by_type(self._node_frequencies)
+
+            if cache_path:
+                self._write_cache(cache_path, (
+                    self.shortest_paths, self.pair_frequencies, self.normalized_frequencies,
+                    self.analyzed_nodes, self._dependencies, total_paths_found
+                ))
+            self._log(f"Found {total_paths_found} shortest paths analyzing {num_pairs} pairs",
+                      "=== Path Analysis Complete ===\n")
             return total_paths_found
             
         except Exception as e:
@@ -296,104 +1064,87 @@ class ProteinNetworkAnalyzer:
     def calculate_centrality(self):
         """
         Calculate normalized betweenness centrality for all encountered nodes.
-        Uses NetworkX's built-in normalization only.
+
+        Only shortest paths between the analyzed protein pairs are counted. The
+        pair dependencies are accumulated while analyze_paths enumerates those
+        paths, so no further traversal of the network is needed here; the scores
+        are rescaled with the normalization NetworkX uses for
+        ``betweenness_centrality_subset`` over the analyzed subgraph. The scores
+        are computed once per analysis and reused by later calls, such as the
+        report generators.
+
+        A directed analysis reports each pair only from the protein selected
+        first, but its dependencies cover both orientations of every pair, so
+        the scores equal NetworkX's subset betweenness with the selection as
+        sources and targets whatever the selection order.
         
         Returns:
             dict: Mapping of nodes to their normalized centrality scores
         """
         if not self.analyzed_nodes:
             return {}
+        if self._centrality_scores is not None:
+            return dict(self._centrality_scores)
             
-        print("\n=== Starting Centrality Calculation ===")
-        analyzed_subgraph = self.directed_graph.subgraph(self.analyzed_nodes)
-        normalized_centrality = defaultdict(float)
+        self._log("\n=== Starting Centrality Calculation ===")
+        n = len(self.analyzed_nodes)
+        scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+        if not self._directed_analysis:
+            # NetworkX counts each undirected pair in both directions
+            scale *= 2
+
+        normalized_centrality = dict.fromkeys(self.analyzed_nodes, 0.0)
+        for node_id, dependency in self._dependencies.items():
+            normalized_centrality[self.id_to_node[node_id]] = dependency * scale
         
-        try:
-            if len(self.analyzed_nodes) < 1000:
-                return nx.betweenness_centrality(
-                    analyzed_subgraph,
-                    normalized=True
-                )
-        except:
-            pass
-            
-        components = list(nx.weakly_connected_components(analyzed_subgraph) 
-                        if analyzed_subgraph.is_directed() 
-                        else nx.connected_components(analyzed_subgraph))
-        
-        chunk_size = max(1, len(components) // (os.cpu_count() or 4))
-        component_chunks = [components[i:i + chunk_size] 
-                        for i in range(0, len(components), chunk_size)]
-        
-        with ProcessPoolExecutor() as executor:
-            futures = []
-            for chunk in component_chunks:
-                for comp in chunk:
-                    if len(comp) <= 1:
-                        normalized_centrality.update({node: 0.0 for node in comp})
-                        continue
-                        
-                    subgraph = analyzed_subgraph.subgraph(comp)
-                    futures.append(executor.submit(
-                        nx.betweenness_centrality,
-                        subgraph,
-                        normalized=True
-                    ))
-                        
-            for future, comp in zip(as_completed(futures), 
-                                (c for chunk in component_chunks 
-                                for c in chunk if len(c) > 1)):
-                try:
-                    normalized_centrality.update(future.result())
-                except Exception as e:
-                    print(f"Error in component: {e}")
-                    normalized_centrality.update({node: 0.0 for node in comp})
-        
-        print("=== Centrality Calculation Complete ===\n")
+        self._log("=== Centrality Calculation Complete ===\n")
+        self._centrality_scores = normalized_centrality
         return dict(normalized_centrality)
 
-    def _generate_frequent_nodes_section(self):
+    def _generate_frequent_nodes_section(self, top_k: int = 10):
         """
         Generate HTML content displaying the normalized node frequencies.
         
         Creates a formatted section showing how often each node appears in the 
         shortest paths, normalized by the number of paths and grouped by node type.
+        Only the top_k most frequent nodes of each type are listed.
+        
+        Args:
+            top_k (int, optional): Number of nodes listed per type. Defaults to 10
         
         Returns:
             str: HTML-formatted string containing tables of node frequencies
         """
-        html = """
+        parts = ["""
         <p>These frequencies represent how often each node appears in the shortest paths, 
         normalized by the number of shortest paths for each protein pair.</p>
-        """
+        """]
         
         normalized_freqs = self.get_normalized_frequencies()
         
         for node_type, normalized_occurrences in normalized_freqs.items():
-            sorted_nodes = sorted(normalized_occurrences.items(), 
-                                key=lambda x: x[1], 
-                                reverse=True)
+            sorted_nodes = heapq.nlargest(top_k, normalized_occurrences.items(), key=itemgetter(1))
             
             if sorted_nodes:
-                html += f"""
-                    <h3>Type: {node_type}</h3>
+                parts.append(f"""
+                    <h3>Type: {_html_escape(node_type)}</h3>
                     <table>
                         <tr>
                             <th>Node</th>
                             <th>Normalized Frequency</th>
                         </tr>
-                """
+                """)
                 
                 for node, norm_freq in sorted_nodes:
-                    html += f"""
+                    parts.append(f"""
                         <tr>
-                            <td>{node}</td>
+                            <td>{_html_escape(node)}</td>
                             <td>{norm_freq:.4f}</td>
                         </tr>
-                    """
-                html += "</table>"
+                    """)
+                parts.append("</table>")
         
-        return html
+        return "".join(parts)
 
     def _generate_pair_frequencies_section(self):
         """
@@ -409,46 +1160,47 @@ class ProteinNetworkAnalyzer:
         if not self.pair_frequencies:
             return "<p>No pair frequencies available.</p>"
 
-        html = """
+        parts = ["""
         <div class="pair-frequencies">
             <p>Each frequency shown below represents the number of times a node appears in the shortest paths 
             between a specific pair, normalized by the total number of shortest paths for that pair.</p>
-        """
+        """]
         
         for pair, freq_data in sorted(self.pair_frequencies.items()):
             start, end = pair
-            html += f"""
+            parts.append(f"""
             <div class="pair-section">
-                <h3>Pair: {start} ↔ {end}</h3>
+                <h3>Pair: {_html_escape(start)} ↔ {_html_escape(end)}</h3>
                 <div class="scrollable-wrapper">
-            """
+            """)
             
             for node_type, frequencies in freq_data.items():
                 if frequencies:  # Only show node types that have frequencies
-                    html += f"""
-                    <h4>Node Type: {node_type}</h4>
+                    parts.append(f"""
+                    <h4>Node Type: {_html_escape(node_type)}</h4>
                     <table>
                         <tr>
                             <th>Node</th>
                             <th>Normalized Frequency</th>
                         </tr>
-                    """
+                    """)
                     
                     for node, freq in sorted(frequencies.items(), key=lambda x: x[1], reverse=True):
-                        html += f"""
+                        parts.append(f"""
                         <tr>
-                            <td>{node}</td>
+                            <td>{_html_escape(node)}</td>
                             <td>{freq:.4f}</td>
                         </tr>
-                        """
-                    html += "</table>"
+                        """)
+                    parts.append("</table>")
             
-            html += """
+            parts.append("""
                 </div>
             </div>
-            """
+            """)
         
-        return html + "</div>"
+        parts.append("</div>")
+        return "".join(parts)
     
     def _generate_shortest_paths_html(self) -> str:
         """
@@ -467,7 +1219,7 @@ class ProteinNetworkAnalyzer:
             return "<p>No paths found.</p>"
         
         total_paths = len(self.shortest_paths)
-        html = f"""
+        parts = [f"""
         <style>
             .paths-table {{ margin-top: 20px; }}
             .paths-stats {{ margin-bottom: 20px; padding: 10px; background-color: #f8f9fa; border-radius: 5px; }}
@@ -476,16 +1228,15 @@ class ProteinNetworkAnalyzer:
         <div class="paths-stats">
             <p><strong>Total paths found: </strong>{total_paths}</p>
         </div>
-        """
+        """]
         
-        paths_by_length = defaultdict(list)
-        for path_info in self.shortest_paths:
-            paths_by_length[path_info['length']].append(path_info)
-        
-        for length in sorted(paths_by_length.keys()):
-            html += self._generate_path_length_section(length, paths_by_length[length])
+        shortest_paths, path_strings = self.shortest_paths, self._path_strings(' → ')
+        for length in sorted(self._paths_by_length):
+            parts.append(self._generate_path_length_section(length, [
+                (shortest_paths[index], path_strings[index]) for index in self._paths_by_length[length]
+            ]))
             
-        return html
+        return "".join(parts)
     
     def _generate_path_length_section(self, length: int, paths: list) -> str:
         """
@@ -503,17 +1254,16 @@ class ProteinNetworkAnalyzer:
 
         Args:
             length (int): The length of the paths in this section (number of edges)
-            paths (list): List of path dictionaries, each containing:
-                - 'start': Starting node identifier
-                - 'end': Ending node identifier
-                - 'path': List of nodes in the path order
+            paths (list): List of (path_info, path_str) pairs, where path_info is a
+                (start_id, end_id, path_ids, length) record from shortest_paths and
+                path_str the names along the path joined by arrows
 
         Returns:
             str: HTML string containing:
                 - A section header with path length info
                 - A formatted table of all paths
         """
-        html = f"""
+        parts = [f"""
         <div class="path-length-header">
             <h3>Paths of length {length} ({len(paths)} paths found)</h3>
         </div>
@@ -523,37 +1273,37 @@ class ProteinNetworkAnalyzer:
                 <th>End</th>
                 <th>Path</th>
             </tr>
-        """
+        """]
         
-        sorted_paths = sorted(paths, key=lambda x: x['start'])
-        for path_info in sorted_paths:
-            path_str = " → ".join(path_info['path'])
-            html += f"""
+        id_to_node = self.id_to_node
+        sorted_paths = sorted(paths, key=lambda x: id_to_node[x[0][0]])
+        parts.extend(f"""
             <tr>
-                <td>{path_info['start']}</td>
-                <td>{path_info['end']}</td>
-                <td>{path_str}</td>
+                <td>{_html_escape(id_to_node[path_info[0]])}</td>
+                <td>{_html_escape(id_to_node[path_info[1]])}</td>
+                <td>{_html_escape(path_str)}</td>
             </tr>
-            """
+            """ for path_info, path_str in sorted_paths)
         
-        html += "</table>"
-        return html
+        parts.append("</table>")
+        return "".join(parts)
 
-    def _generate_centrality_section(self, centrality_scores: dict) -> str:
+    def _generate_centrality_section(self, centrality_scores: dict, top_k: int = 10) -> str:
         """
         Generate HTML content displaying betweenness centrality analysis results grouped by node type.
         
-        This method creates a formatted HTML section showing the top 10 nodes with highest
+        This method creates a formatted HTML section showing the top_k nodes with highest
         centrality scores for each node type in the network. The centrality scores indicate
         how important each node is in terms of its position in the network's paths.
 
         Args:
             centrality_scores (dict): Dictionary mapping node identifiers to their betweenness
                 centrality scores. Format: {node_id: float_score}
+            top_k (int, optional): Number of nodes listed per type. Defaults to 10
 
         Returns:
             str: HTML-formatted string containing either:
-                - Multiple tables showing top 10 nodes by type, each with their centrality scores
+                - Multiple tables showing top_k nodes by type, each with their centrality scores
                 - A "No centrality scores available" message if the input dictionary is empty
         """
         if not centrality_scores:
@@ -565,14 +1315,13 @@ class ProteinNetworkAnalyzer:
             nodes_by_type[node_type].append((node, score))
         
         for node_type in nodes_by_type:
-            nodes_by_type[node_type].sort(key=lambda x: x[1], reverse=True)
-            nodes_by_type[node_type] = nodes_by_type[node_type][:10]
+            nodes_by_type[node_type] = heapq.nlargest(top_k, nodes_by_type[node_type], key=itemgetter(1))
         
-        tables_html = ""
+        parts = []
         for node_type, nodes in sorted(nodes_by_type.items()):
-            tables_html += f"""
+            parts.append(f"""
             <div class="centrality-type-section">
-                <h3>Top 10 {node_type} Nodes</h3>
+                <h3>Top {top_k} {_html_escape(node_type)} Nodes</h3>
                 <table>
                     <thead>
                         <tr>
@@ -581,25 +1330,25 @@ class ProteinNetworkAnalyzer:
                         </tr>
                     </thead>
                     <tbody>
-            """
+            """)
             
             for node, score in nodes:
-                tables_html += f"""
+                parts.append(f"""
                     <tr>
-                        <td>{node}</td>
+                        <td>{_html_escape(node)}</td>
                         <td>{score:.6f}</td>
                     </tr>
-                """
+                """)
                 
-            tables_html += """
+            parts.append("""
                     </tbody>
                 </table>
             </div>
-            """
+            """)
         
-        return tables_html
+        return "".join(parts)
     
-    def generate_html_report(self, execution_time: float) -> str:
+    def generate_html_report(self, execution_time: float, top_k: int = 10) -> str:
         """
         Generate a comprehensive HTML report of the network analysis.
         
@@ -612,206 +1361,115 @@ class ProteinNetworkAnalyzer:
         
         Args:
             execution_time (float): Total execution time of the analysis in seconds
+            top_k (int, optional): Number of most frequent and most central nodes listed per
+                node type. Defaults to 10
         
         Returns:
             str: Complete HTML document string containing all analysis results
         """
-        print("\n=== Starting HTML Report Generation ===")
-        print("Compiling analysis results...")
-        centrality_scores = self.calculate_centrality()
-        
-        template = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <title>Protein Network Analysis Report</title>
-            <style>
-                body {{ 
-                    font-family: Arial, sans-serif; 
-                    margin: 2rem; 
-                    color: #333; 
-                    line-height: 1.6; 
-                }}
-                .container {{ 
-                    max-width: 1200px; 
-                    margin: 0 auto; 
-                }}
-                table {{ 
-                    width: 100%; 
-                    border-collapse: collapse; 
-                    margin: 1rem 0;
-                    table-layout: fixed;
-                }}
-                th, td {{ 
-                    padding: 0.5rem; 
-                    border: 1px solid #ddd; 
-                    text-align: left;
-                    min-width: 150px;
-                    max-width: 300px;
-                }}
-                td {{ 
-                    white-space: nowrap;
-                    overflow-x: auto;
-                    position: relative;
-                }}
-                td::-webkit-scrollbar {{
-                    height: 8px;
-                }}
-                td::-webkit-scrollbar-track {{
-                    background: #f1f1f1;
-                    border-radius: 4px;
-                }}
-                td::-webkit-scrollbar-thumb {{
-                    background: #888;
-                    border-radius: 4px;
-                }}
-                td::-webkit-scrollbar-thumb:hover {{
-                    background: #555;
-                }}
-                td.scrollable::after {{
-                    content: '⟷';
-                    position: absolute;
-                    right: 4px;
-                    top: 50%;
-                    transform: translateY(-50%);
-                    color: #888;
-                    font-size: 12px;
-                    opacity: 0.7;
-                }}
-                th {{ 
-                    background-color: #f5f5f5; 
-                    position: sticky;
-                    top: 0;
-                    z-index: 10;
-                }}
-                tr:nth-child(even) {{ 
-                    background-color: #f9f9f9; 
-                }}
-                tr:hover {{ 
-                    background-color: #f5f5f5; 
-                }}
-                .section {{ 
-                    margin: 2rem 0; 
-                    padding: 1rem; 
-                    border-radius: 5px; 
-                    background-color: #fff; 
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1); 
-                }}
-                .scrollable-wrapper {{
-                    overflow-x: auto;
-                    margin: 1rem 0;
-                    padding-bottom: 1rem;
-                }}
-                h1, h2 {{ 
-                    color: #2c3e50; 
-                    margin-top: 0; 
-                }}
-                .meta-info {{ 
-                    color: #666; 
-                    font-size: 0.9rem; 
-                }}
-                .sticky-header {{ 
-                    position: sticky; 
-                    top: 0; 
-                    background-color: white; 
-                    z-index: 20; 
-                    padding: 1rem 0; 
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="sticky-header">
-                    <h1>Protein Network Analysis Report</h1>
-                    <div class="meta-info">
-                        <p>Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                        <p>Total execution time: {execution_time:.2f} seconds</p>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>Network Overview</h2>
-                    <div class="scrollable-wrapper">
-                        <p>Total proteins found: {len(self.proteins)}</p>
-                        <p>Total nodes in network: {len(self.graph.nodes)}</p>
-                    </div>
-                </div>
-
-                <div class="section">
-                    <h2>Shortest Paths Analysis</h2>
-                    <div class="scrollable-wrapper">
-                        {self._generate_shortest_paths_html()}
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>Node Frequencies</h2>
-                    <div class="scrollable-wrapper">
-                        {self._generate_frequent_nodes_section()}
-                    </div>
-                </div>
+        return "".join(self.iter_html_report(execution_time, top_k))
 
-                <div class="section">
-                    <h2>Centrality Analysis</h2>
-                    <div class="scrollable-wrapper">
-                        {self._generate_centrality_section(centrality_scores)}
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
+    def iter_html_report(self, execution_time: float, top_k: int = 10):
         """
-        print("Report generation successful")
-        print("=== HTML Report Generation Complete ===\n")
-        return template
+        Generate the HTML report of the network analysis section by section.
+
+        Joining the yielded strings gives the same document as generate_html_report,
+        but only one section is held in memory at a time while the report is written.
+
+        Args:
+            execution_time (float): Total execution time of the analysis in seconds
+            top_k (int, optional): Number of most frequent and most central nodes listed per
+                node type. Defaults to 10
 
+        Yields:
+            str: Consecutive chunks of the HTML document
+        """
+        self._log("\n=== Starting HTML Report Generation ===",
+                  "Compiling analysis results...")
+        centrality_scores = self.calculate_centrality()
+        
+        page = _HTML_REPORT_TEMPLATE.safe_substitute(
+            generated_on=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            execution_time=f"{execution_time:.2f}",
+            num_proteins=len(self.proteins),
+            num_nodes=len(self.id_to_node)
+        )
+        sections = (
+            ("$paths_html", self._generate_shortest_paths_html),
+            ("$frequencies_html", lambda: self._generate_frequent_nodes_section(top_k)),
+            ("$centrality_html", lambda: self._generate_centrality_section(centrality_scores, top_k)),
+        )
+        # The sections appear in this order in the template
+        for placeholder, render_section in sections:
+            head, page = page.split(placeholder, 1)
+            yield head
+            yield render_section()
+        yield page
+        self._log("Report generation successful",
+                  "=== HTML Report Generation Complete ===\n")
 
-    def generate_txt_report(self, execution_time: float) -> str:
+    def generate_txt_report(self, execution_time: float, top_k: int = 10) -> str:
         """
         Generate a plain text report of the network analysis.
 
         Args:
             execution_time (float): Total execution time of the analysis in seconds
+            top_k (int, optional): Number of nodes listed per node type in the frequency
+                and centrality sections. Defaults to 10
 
         Returns:
             str: Formatted text report containing analysis results
         """
-        print("\n=== Starting TXT Report Generation ===")
-        print("Compiling analysis results...")
+        return "".join(self.iter_txt_report(execution_time, top_k))
+
+    def iter_txt_report(self, execution_time: float, top_k: int = 10):
+        """
+        Generate a plain text report of the network analysis section by section.
+
+        Joining the yielded strings gives the same text as generate_txt_report,
+        but the report can be written out without holding all of it in memory.
+
+        Args:
+            execution_time (float): Total execution time of the analysis in seconds
+            top_k (int, optional): Number of nodes listed per node type in the frequency
+                and centrality sections. Defaults to 10
+
+        Yields:
+            str: Consecutive chunks of the formatted text report
+        """
+        self._log("\n=== Starting TXT Report Generation ===",
+                  "Compiling analysis results...")
         
         centrality_scores = self.calculate_centrality()
         
-        lines = [
-            "=== Protein Network Analysis ===",
-            f"Executed on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Execution time: {execution_time:.2f} seconds\n",
-            "=== General Statistics ===",
-            f"Number of proteins: {len(self.proteins)}",
-            f"Analyzed paths: {len(self.shortest_paths)}\n",
-            "=== Shortest Paths ==="
-        ]
-
-        paths_by_length = defaultdict(list)
-        for path_info in self.shortest_paths:
-            paths_by_length[path_info['length']].append(path_info)
-        
-        for length in sorted(paths_by_length.keys()):
-            lines.append(f"\nPaths of length {length} ({len(paths_by_length[length])} paths):")
-            for info in paths_by_length[length]:
-                path_str = " -> ".join(info['path'])
-                lines.append(f"From {info['start']} to {info['end']}:\n{path_str}")
-
-        lines.append("\n=== Node Frequencies by Type ===")
+        yield self.TXT_REPORT_HEADER.format(
+            executed_on=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            execution_time=execution_time,
+            num_proteins=len(self.proteins),
+            num_paths=len(self.shortest_paths)
+        )
+
+        id_to_node = self.id_to_node
+        shortest_paths, path_strings = self.shortest_paths, self._path_strings(" -> ")
+        
+        # Every entry starts with its own line break, so chunks are emitted as-is
+        for length in sorted(self._paths_by_length):
+            indices = self._paths_by_length[length]
+            yield f"\n\nPaths of length {length} ({len(indices)} paths):"
+            yield "".join([
+                f"\nFrom {id_to_node[shortest_paths[index][0]]} to {id_to_node[shortest_paths[index][1]]}:"
+                f"\n{path_strings[index]}"
+                for index in indices
+            ])
+
+        yield "\n\n=== Node Frequencies by Type ==="
         normalized_freqs = self.get_normalized_frequencies()
         for node_type, frequencies in normalized_freqs.items():
-            lines.append(f"\nType: {node_type}")
-            # Sort by frequency and show top 10
-            sorted_nodes = sorted(frequencies.items(), key=lambda x: x[1], reverse=True)[:10]
-            for node, freq in sorted_nodes:
-                lines.append(f"{node}: {freq:.4f}")
+            # Sort by frequency and show the top_k nodes
+            sorted_nodes = heapq.nlargest(top_k, frequencies.items(), key=itemgetter(1))
+            yield f"\n\nType: {node_type}" + "".join([f"\n{node}: {freq:.4f}" for node, freq in sorted_nodes])
 
-        lines.append("\n=== Centrality Analysis ===")
+        yield "\n\n=== Centrality Analysis ==="
         if centrality_scores:
             nodes_by_type = defaultdict(list)
             for node, score in centrality_scores.items():
@@ -819,18 +1477,51 @@ class ProteinNetworkAnalyzer:
                 nodes_by_type[node_type].append((node, score))
             
             for node_type, nodes in sorted(nodes_by_type.items()):
-                nodes.sort(key=lambda x: x[1], reverse=True)
-                top_nodes = nodes[:10]  # Show top 10 nodes per type
+                top_nodes = heapq.nlargest(top_k, nodes, key=itemgetter(1))  # Show top_k nodes per type
                 if top_nodes:
-                    lines.append(f"\nTop {len(top_nodes)} {node_type} Nodes by Centrality:")
-                    for node, score in top_nodes:
-                        lines.append(f"{node}: {score:.6f}")
+                    yield (f"\n\nTop {len(top_nodes)} {node_type} Nodes by Centrality:"
+                           + "".join([f"\n{node}: {score:.6f}" for node, score in top_nodes]))
         else:
-            lines.append("No centrality scores available.")
+            yield "\nNo centrality scores available."
+
+        self._log("Report generation successful",
+                  "=== TXT Report Generation Complete ===\n")
 
-        print("Report generation successful")
-        print("=== TXT Report Generation Complete ===\n")
-        return "\n".join(lines)
+# Report extension and renderer for each --format choice. A renderer yields
+# the report in chunks that are streamed to disk.
+REPORT_FORMATS = {
+    'html': ('.html', ProteinNetworkAnalyzer.iter_html_report),
+    'txt': ('.txt', ProteinNetworkAnalyzer.iter_txt_report),
+}
+
+def _write_report(filename: str, chunks, compress: bool = False):
+    """
+    Write a report to disk as UTF-8, streaming it chunk by chunk.
+
+    The chunks are encoded one at a time and go through a large write buffer,
+    so the file receives few write calls without the whole report being held
+    in memory. The report is first written to a ".partial" file that replaces
+    the target only once it is complete, so an interrupted write never leaves
+    a truncated report.
+
+    Args:
+        filename (str): Path of the report file
+        chunks (Iterable[str]): Consecutive chunks of the report
+        compress (bool, optional): Write the report gzip-compressed at the fastest
+            compression level. Defaults to False
+    """
+    partial_name = f"{filename}.partial"
+    try:
+        f = (gzip.open(partial_name, 'wb', compresslevel=1) if compress
+             else open(partial_name, 'wb', buffering=1 << 20))
+        with f:
+            for chunk in chunks:
+                f.write(chunk.encode('utf-8'))
+        os.replace(partial_name, filename)
+    except BaseException:
+        if os.path.exists(partial_name):
+            os.remove(partial_name)
+        raise
 
 def main():
     """
@@ -850,12 +1541,16 @@ def main():
         -r, --random-nodes: Number of nodes to select randomly
         -l, --node-list: List of specific nodes to analyze
         --disable-blacklist: Disable the default metabolite blacklist
+        --no-cache: Run without reading or writing the graph and path analysis caches
+        -q, --quiet: Don't print analysis progress messages
+        --top-k: Number of nodes listed per node type in the report rankings (default: 10)
+        --compress: Write the report gzip-compressed with a .gz extension
     """
     parser = argparse.ArgumentParser(description="Analyze protein interaction networks")
-    parser.add_argument('-f', '--file', required=True, help="Path to GraphML file")
-    parser.add_argument('-o', '--output', default='network_analysis.html',
+    parser.add_argument('-f', '--file', required=True, type=Path, help="Path to GraphML file")
+    parser.add_argument('-o', '--output', default='network_analysis.html', type=Path,
                        help="Output file path")
-    parser.add_argument('--format', choices=['html', 'txt'], default='html',
+    parser.add_argument('--format', choices=list(REPORT_FORMATS), default='html',
                        help="Output report format")
     parser.add_argument('--no-open', action='store_true',
                        help="Don't automatically open the report")
@@ -866,13 +1561,29 @@ def main():
                            help="List of specific nodes to analyze")
     parser.add_argument('--disable-blacklist', action='store_true',
                        help="Disable the default metabolite blacklist")
+    parser.add_argument('--no-cache', action='store_true',
+                       help="Don't read or write the graph and path analysis caches")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                       help="Don't print analysis progress messages")
+    parser.add_argument('--top-k', type=int, default=10,
+                       help="Number of nodes listed per node type in the report rankings")
+    parser.add_argument('--compress', action='store_true',
+                       help="Write the report gzip-compressed (adds a .gz extension)")
     args = parser.parse_args()
+    if not args.file.is_file():
+        parser.error(f"GraphML file not found: {args.file}")
+    if not args.output.name:
+        parser.error(f"Output path has no file name: {args.output}")
+    if args.top_k < 1:
+        parser.error("--top-k must be at least 1")
     start_time = time.time()
     
     try:
         analyzer = ProteinNetworkAnalyzer(
             args.file,
-            custom_blacklist=set() if args.disable_blacklist else None
+            custom_blacklist=set() if args.disable_blacklist else None,
+            use_cache=not args.no_cache,
+            verbose=not args.quiet
         )
     except Exception as e:
         print(f"Error initializing network analyzer: {e}")
@@ -884,6 +1595,12 @@ def main():
             node_list=args.node_list
         )
         print(f"Successfully analyzed {paths_found} paths")
+    except KeyboardInterrupt:
+        # Keep the pairs completed so far rather than discarding the whole run
+        if not analyzer.shortest_paths:
+            print("\nAnalysis interrupted before any path was found")
+            return
+        print(f"\nAnalysis interrupted: reporting the {len(analyzer.shortest_paths)} paths found so far")
     except ValueError as e:
         print(f"Error: {str(e)}")
         return
@@ -893,18 +1610,14 @@ def main():
     
     execution_time = time.time() - start_time
     
-    if args.format == 'html':
-        content = analyzer.generate_html_report(execution_time)
-        extension = '.html'
-    else:
-        content = analyzer.generate_txt_report(execution_time)
-        extension = '.txt'
-
-    filename = os.path.splitext(args.output)[0] + extension
+    extension, render_report = REPORT_FORMATS[args.format]
+    report_chunks = render_report(analyzer, execution_time, top_k=args.top_k)
+    filename = args.output.with_suffix(extension)
+    if args.compress:
+        filename = filename.with_name(filename.name + '.gz')
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_report(filename, report_chunks, compress=args.compress)
         print(f"\nReport saved to: {filename}")
     except Exception as e:
         print(f"Error saving report: {e}")
@@ -917,10 +1630,10 @@ def main():
         try:
             if os.name == 'nt':
                 os.startfile(absolute_path)
-            elif os.name == 'darwin':
-                os.system(f'open "{absolute_path}"')
             else:
-                os.system(f'xdg-open "{absolute_path}"')
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen([opener, absolute_path], stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, close_fds=True)
             print("Opening report in default application...")
         except Exception as e:
             print(f"Error opening file: {e}")
@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import networkx as nx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Protein_Network_Analyzer import ProteinNetworkAnalyzer
+
+
+class AnalysisCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        # A -> X -> B: only the pair (A, B) has a directed path
+        graph = nx.DiGraph()
+        for node, name, node_type in (("n0", "A", "Protein"), ("n1", "X", "SmallMolecule"),
+                                      ("n2", "B", "Protein")):
+            graph.add_node(node, name=name, biopaxType=node_type)
+        graph.add_edges_from([("n0", "n1"), ("n1", "n2")])
+        self.graphml_file = os.path.join(self.tmp_dir.name, "network.graphml")
+        nx.write_graphml(graph, self.graphml_file)
+
+    def analyze(self, node_list, use_cache=True, directed=True):
+        analyzer = ProteinNetworkAnalyzer(self.graphml_file, use_cache=use_cache, verbose=False)
+        analyzer.analyze_paths(node_list=node_list, directed=directed)
+        return analyzer
+
+    def test_directed_orderings_do_not_share_cache(self):
+        forward = self.analyze(["A", "B"])
+        backward = self.analyze(["B", "A"])
+        self.assertEqual(list(forward.pair_frequencies), [("A", "B")])
+        self.assertEqual(len(forward.shortest_paths), 1)
+        self.assertEqual(backward.pair_frequencies, {})
+        self.assertEqual(backward.shortest_paths, [])
+
+        cached_forward = self.analyze(["A", "B"])
+        self.assertEqual(cached_forward.pair_frequencies, forward.pair_frequencies)
+        self.assertEqual(self.analyze(["B", "A"], use_cache=False).pair_frequencies,
+                         backward.pair_frequencies)
+
+    def test_undirected_orderings_keep_their_orientation(self):
+        forward = self.analyze(["A", "B"], directed=False)
+        backward = self.analyze(["B", "A"], directed=False)
+        fresh_backward = self.analyze(["B", "A"], use_cache=False, directed=False)
+        self.assertEqual(list(forward.pair_frequencies), [("A", "B")])
+        self.assertEqual(list(backward.pair_frequencies), [("B", "A")])
+        self.assertEqual(backward.pair_frequencies, fresh_backward.pair_frequencies)
+
+        endpoints = lambda analyzer: [(analyzer.id_to_node[start], analyzer.id_to_node[end])
+                                      for start, end, _, _ in analyzer.shortest_paths]
+        self.assertEqual(endpoints(forward), [("A", "B")])
+        self.assertEqual(endpoints(backward), [("B", "A")])
+        self.assertEqual(endpoints(backward), endpoints(fresh_backward))
+
+    def test_random_selections_are_not_cached(self):
+        cached_analyses = lambda: [name for name in os.listdir(self.tmp_dir.name) if ".paths." in name]
+        analyzer = ProteinNetworkAnalyzer(self.graphml_file, verbose=False)
+        analyzer.analyze_paths(num_nodes=2)
+        self.assertEqual(cached_analyses(), [])
+        self.analyze(["A", "B"])
+        self.assertEqual(len(cached_analyses()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import networkx as nx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Protein_Network_Analyzer import ProteinNetworkAnalyzer
+
+
+class CentralityTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        graph = nx.gnp_random_graph(60, 0.05, seed=3, directed=True)
+        names = {}
+        for node in graph:
+            node_type = "Protein" if node % 3 == 0 else "Complex"
+            names[node] = f"{node_type}{node}"
+            graph.nodes[node].update(name=names[node], biopaxType=node_type)
+        self.graph = nx.relabel_nodes(graph, {node: f"n{node}" for node in graph})
+        self.named_graph = nx.relabel_nodes(graph, names)
+        self.graphml_file = os.path.join(self.tmp_dir.name, "network.graphml")
+        nx.write_graphml(self.graph, self.graphml_file)
+
+    def assert_matches_networkx(self, directed):
+        analyzer = ProteinNetworkAnalyzer(self.graphml_file, use_cache=False, verbose=False)
+        selection = sorted(analyzer.proteins)
+        scores_by_order = []
+        for node_list in (selection, selection[::-1]):
+            analyzer = ProteinNetworkAnalyzer(self.graphml_file, use_cache=False, verbose=False)
+            analyzer.analyze_paths(node_list=node_list, directed=directed)
+            self.assertTrue(analyzer.shortest_paths)
+            scores_by_order.append(analyzer.calculate_centrality())
+
+        graph = self.named_graph if directed else self.named_graph.to_undirected()
+        subgraph = graph.subgraph(analyzer.analyzed_nodes)
+        sources = [node for node in selection if node in subgraph]
+        expected = nx.betweenness_centrality_subset(subgraph, sources=sources, targets=sources,
+                                                    normalized=True)
+        for scores in scores_by_order:
+            self.assertEqual(set(scores), set(expected))
+            for node, score in expected.items():
+                self.assertAlmostEqual(scores[node], score, places=12, msg=node)
+
+    def test_directed_matches_networkx_subset(self):
+        self.assert_matches_networkx(directed=True)
+
+    def test_undirected_matches_networkx_subset(self):
+        self.assert_matches_networkx(directed=False)
+
+
+if __name__ == "__main__":
+    unittest.main()